@@ -14,6 +14,7 @@ from itertools import chain
 import logging
 import pathlib
 
+import numpy as np
 from obspy import read, Stream, UTCDateTime
 
 import quakemigrate.util as util
@@ -578,8 +579,10 @@ class WaveformData:
                 st_id = st.select(id=tr_id)
                 availability[tr_id] = 0
 
-                # Check it's not flatlined
-                if any(tr.data.max() == tr.data.min() for tr in st_id):
+                # Check it's not flatlined - a single vectorised pass per trace
+                # (comparison against the first sample), rather than separate full
+                # max() and min() reductions
+                if not all(np.any(tr.data != tr.data[0]) for tr in st_id):
                     continue
                 # Check for overlaps
                 overlaps = st_id.get_gaps(max_gap=-0.000001)
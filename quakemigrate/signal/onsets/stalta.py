@@ -12,14 +12,32 @@ calculates STA/LTA onset (characteristic) function.
 """
 
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 import numpy as np
 from obspy import Stream
+from obspy.signal.invsim import cosine_taper
 from obspy.signal.trigger import classic_sta_lta
+from scipy.signal import detrend, iirfilter, sosfiltfilt, zpk2sos
 
 import quakemigrate.util as util
 from .base import Onset, OnsetData
 
+# Numba is an optional dependency, used to accelerate the STA/LTA calculation. If it is
+# not available, fall back to a (slower) pure-NumPy implementation.
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Smallest positive normal float; used to guard against division by zero. Module-level
+# so it is baked into the compiled Numba kernels as a constant.
+_DTINY = np.finfo(np.float64).tiny
+
 
 def sta_lta_centred(signal, nsta, nlta):
     """
@@ -27,6 +45,9 @@ def sta_lta_centred(signal, nsta, nlta):
     preceding long-term (noise) window. STA/LTA value is assigned to the end of the LTA
     /one sample before the start of the STA.
 
+    Uses a compiled Numba kernel if numba is installed; otherwise falls back to a
+    pure-NumPy implementation.
+
     Parameters
     ----------
     signal : array-like
@@ -45,35 +66,267 @@ def sta_lta_centred(signal, nsta, nlta):
 
     """
 
-    # Cumulative sum to calculate moving average
-    sta = np.cumsum(signal**2)
-    sta = np.require(sta, dtype=float)
-    lta = sta.copy()
+    if NUMBA_AVAILABLE:
+        signal = np.ascontiguousarray(signal)
+        if not np.issubdtype(signal.dtype, np.floating):
+            signal = signal.astype(np.float64)
+        return _sta_lta_centred_numba(signal, nsta, nlta)
+    return _sta_lta_centred_numpy(signal, nsta, nlta)
+
+
+def _sta_lta_centred_numba(signal, nsta, nlta):
+    """
+    Numba kernel for the centred STA/LTA. Builds a prefix sum of the signal energy in a
+    single pass, then reads each STA/LTA value directly off the prefix sum - no
+    intermediate moving-average arrays are allocated.
+
+    The signal may be float32 or float64 (numba specializes the kernel per dtype);
+    accumulation is always performed in float64, to avoid precision loss in the prefix
+    sum over long traces.
+
+    """
 
-    # Compute the STA and the LTA
-    sta[nsta:] = sta[nsta:] - sta[:-nsta]
-    sta[nsta:-nsta] = sta[nsta * 2 :]
-    sta /= nsta
+    npts = signal.shape[0]
+    onset = np.zeros(npts, dtype=np.float64)
+
+    # Single-pass prefix sum of the signal energy; leading zero simplifies the
+    # window-sum arithmetic below.
+    csum = np.empty(npts + 1, dtype=np.float64)
+    csum[0] = 0.0
+    for i in range(npts):
+        sample = float(signal[i])
+        csum[i + 1] = csum[i] + sample * sample
+
+    # Value is assigned to the end of the LTA window / one sample before the start of
+    # the STA window. Samples before the first complete LTA window and after the last
+    # complete STA window are left as zero.
+    for i in range(nlta - 1, npts - nsta):
+        lta = (csum[i + 1] - csum[i + 1 - nlta]) / nlta
+        if lta < _DTINY:
+            # Avoid division by zero - onset is left as zero.
+            continue
+        sta = (csum[i + 1 + nsta] - csum[i + 1]) / nsta
+        onset[i] = sta / lta
+
+    return onset
+
+
+def _sta_lta_classic_numba(signal, nsta, nlta):
+    """
+    Numba kernel for the classic STA/LTA, equivalent to
+    :func:`obspy.signal.trigger.classic_sta_lta` - the STA window sits within the LTA
+    window, and the value is assigned to the end of both windows. Inlining it here
+    removes the per-channel Python/obspy call overhead and the cumsum temporaries.
+
+    As for the centred kernel, the signal may be float32 or float64; accumulation is
+    always performed in float64.
+
+    """
 
-    lta[nlta:] = lta[nlta:] - lta[:-nlta]
-    lta /= nlta
+    npts = signal.shape[0]
+    onset = np.zeros(npts, dtype=np.float64)
 
-    sta[: (nlta - 1)] = 0
-    sta[-nsta:] = 0
+    csum = np.empty(npts + 1, dtype=np.float64)
+    csum[0] = 0.0
+    for i in range(npts):
+        sample = float(signal[i])
+        csum[i + 1] = csum[i] + sample * sample
+
+    # Samples before the first complete LTA window are left as zero.
+    for i in range(nlta - 1, npts):
+        sta = (csum[i + 1] - csum[i + 1 - nsta]) / nsta
+        lta = (csum[i + 1] - csum[i + 1 - nlta]) / nlta
+        if lta < _DTINY:
+            # Avoid division by zero - as in obspy, the LTA (only) is clamped.
+            lta = _DTINY
+        onset[i] = sta / lta
+
+    return onset
+
+
+def _onset_multi(signals, nsta, nlta, classic, log, trim_start, trim_end):
+    """
+    Fused Numba kernel computing the combined onset function for a station directly
+    from the stacked channel signals, shape(nchannels, npts). The per-channel STA/LTA,
+    the taper-region trimming, the clip/log onset transform and the root-mean-square
+    channel combination are all applied per sample, streaming off the energy prefix
+    sums - the per-channel onset functions are never materialized.
+
+    `classic` selects the STA/LTA position; `trim_start`/`trim_end` give the number of
+    leading/trailing samples in which the STA/LTA is to be disregarded (zero for both
+    if no timespan was provided).
+
+    """
+
+    nchannels, npts = signals.shape
+
+    # Per-channel energy prefix sums - the only per-channel intermediate.
+    csum = np.empty((nchannels, npts + 1), dtype=np.float64)
+    for i in range(nchannels):
+        csum[i, 0] = 0.0
+        for j in range(npts):
+            sample = float(signals[i, j])
+            csum[i, j + 1] = csum[i, j] + sample * sample
+
+    # Channel-major accumulation: each channel's prefix-sum row is swept with unit
+    # stride (contiguous rows), which lets LLVM auto-vectorize the sample loop.
+    onset = np.zeros(npts, dtype=np.float64)
+    for i in range(nchannels):
+        row = csum[i]
+        for j in prange(npts):
+            # STA/LTA ratio for this channel and sample; zero outside the valid window
+            # range and within the (optional) trimmed taper regions.
+            ratio = 0.0
+            if trim_start <= j < npts - trim_end:
+                if classic:
+                    if j >= nlta - 1:
+                        sta = (row[j + 1] - row[j + 1 - nsta]) / nsta
+                        lta = (row[j + 1] - row[j + 1 - nlta]) / nlta
+                        if lta < _DTINY:
+                            lta = _DTINY
+                        ratio = sta / lta
+                elif nlta - 1 <= j < npts - nsta:
+                    lta = (row[j + 1] - row[j + 1 - nlta]) / nlta
+                    if lta >= _DTINY:
+                        sta = (row[j + 1 + nsta] - row[j + 1]) / nsta
+                        ratio = sta / lta
+            # Onset transform - log(max(1 + ratio, 0.8)) - and RMS accumulation.
+            value = 1.0 + ratio
+            if value < 0.8:
+                value = 0.8
+            if log:
+                value = np.log(value)
+            onset[j] += value * value
+
+    for j in prange(npts):
+        onset[j] = np.sqrt(onset[j] / nchannels)
+
+    return onset
+
+
+# Numba specializes each kernel per input dtype at runtime; cache=True persists the
+# compiled specializations to disk, so the compilation cost is only paid once rather
+# than on every run.
+if NUMBA_AVAILABLE:
+    _sta_lta_centred_numba = njit(cache=True)(_sta_lta_centred_numba)
+    _sta_lta_classic_numba = njit(cache=True)(_sta_lta_classic_numba)
+    _onset_multi = njit(parallel=True, cache=True)(_onset_multi)
+
+
+def _sta_lta_centred_numpy(signal, nsta, nlta):
+    """
+    Pure-NumPy fallback for the centred STA/LTA calculation.
+
+    The trailing moving averages are computed by convolution of the signal energy with
+    a boxcar kernel, rather than by differencing a cumulative sum - this avoids the
+    full-length cumsum copies, and each window average is computed independently (no
+    accumulated floating-point error for long traces).
+
+    """
+
+    energy = np.asarray(signal, dtype=np.float64) ** 2
+    npts = len(energy)
+
+    # Trailing moving averages: element i of the 'full' convolution holds the (partial,
+    # for i < window length) window average of energy[i - nsta + 1:i + 1].
+    lta = np.convolve(energy, np.full(nlta, 1 / nlta), mode="full")[:npts]
+
+    # Write the STA directly at its centred position - element i holds the average of
+    # the window *following* the LTA window ending at i - by reading the trailing
+    # average nsta samples ahead, rather than shifting the array into place afterwards.
+    # Samples before the first complete LTA window and after the last complete STA
+    # window are left as zero.
+    sta = np.zeros(npts, dtype=np.float64)
+    sta[nlta - 1 : npts - nsta] = np.convolve(energy, np.full(nsta, 1 / nsta), "full")[
+        nlta - 1 + nsta : npts
+    ]
 
     # Avoid division by zero by setting zero values to tiny float
-    dtiny = np.finfo(float).tiny
-    idx = lta < dtiny
-    lta[idx] = dtiny
+    idx = lta < _DTINY
+    lta[idx] = _DTINY
     sta[idx] = 0.0
 
-    return sta / lta
+    return np.divide(sta, lta, out=sta)
+
+
+@lru_cache(maxsize=None)
+def _taper_window(npts, max_percentage=0.05):
+    """
+    Cosine taper window, identical to that applied by
+    `obspy.Trace.taper(type="cosine", max_percentage=...)`. Cached by trace length, so
+    it is only computed once per unique length rather than once per channel.
+
+    Parameters
+    ----------
+    npts : int
+        Number of samples in the window.
+    max_percentage : float, optional
+        Decimal percentage of taper at one end (ranging from 0. to 0.5).
+
+    Returns
+    -------
+    taper : `numpy.ndarray` of float
+        Taper window, shape(npts).
+
+    """
+
+    wlen = min(int(max_percentage * npts), int(npts / 2))
+    if 2 * wlen == npts:
+        taper_sides = cosine_taper(2 * wlen, p=1.0)
+    else:
+        taper_sides = cosine_taper(2 * wlen + 1, p=1.0)
+
+    return np.hstack(
+        (
+            taper_sides[:wlen],
+            np.ones(npts - 2 * wlen),
+            taper_sides[len(taper_sides) - wlen :],
+        )
+    )
+
+
+def _bandpass_sos(lowcut, highcut, sampling_rate, order):
+    """
+    Design a Butterworth band-pass filter as second-order sections. The design is
+    identical to that used by :func:`obspy.signal.filter.bandpass`.
+
+    Parameters
+    ----------
+    lowcut : float
+        Low-cut frequency for the filter, in Hz.
+    highcut : float
+        High-cut frequency for the filter, in Hz.
+    sampling_rate : int
+        Sampling rate of the data to be filtered, in Hz.
+    order : int
+        Number of corners for the filter. NOTE - two-pass filter effectively doubles
+        the number of corners.
+
+    Returns
+    -------
+    sos : `numpy.ndarray` of float
+        Second-order sections representation of the filter.
+
+    """
+
+    nyquist = 0.5 * sampling_rate
+    z, p, k = iirfilter(
+        order,
+        [lowcut / nyquist, highcut / nyquist],
+        btype="band",
+        ftype="butter",
+        output="zpk",
+    )
+
+    return zpk2sos(z, p, k)
 
 
 def pre_process(stream, sampling_rate, resample, upfactor, filter_, starttime, endtime):
     """
     Resample raw seismic data, detrend and apply cosine taper and zero phase-shift
-    Butterworth band-pass filter; all carried out using the built-in obspy functions.
+    Butterworth band-pass filter. The band-pass filter is applied to all channels (of a
+    given length) at once, as a single 2-D array; it is identical to the built-in obspy
+    bandpass filter.
 
     By default, data with mismatched sampling rates will only be decimated. If
     necessary, and if the user has specified `resample = True` and an `upfactor` to
@@ -134,15 +387,29 @@ def pre_process(stream, sampling_rate, resample, upfactor, filter_, starttime, e
     if highcut >= 0.5 * sampling_rate:
         raise util.NyquistException(highcut, 0.5 * sampling_rate, "")
 
-    # Detrend, apply cosine taper then apply zero-phase band-pass filter
-    # Copy to not operate in-place on the input stream
-    filtered_waveforms = resampled_stream.copy()
-    filtered_waveforms.detrend("linear")
-    filtered_waveforms.detrend("constant")
-    filtered_waveforms.taper(type="cosine", max_percentage=0.05)
-    filtered_waveforms.filter(
-        type="bandpass", freqmin=lowcut, freqmax=highcut, corners=order, zerophase=True
-    )
+    # util.resample always operates on (and returns) a copy of the input stream, and
+    # the filtering below assigns freshly-allocated arrays to the traces, so the input
+    # stream cannot be modified - no further copy of the waveform data is needed.
+    filtered_waveforms = resampled_stream
+
+    # Detrend, taper and band-pass filter the traces as 2-D channel blocks (grouped by
+    # trace length), rather than channel-by-channel. The taper window is cached by
+    # trace length; the detrend, cosine taper and filter (forward/backward, for zero
+    # phase-shift) are identical to their per-trace obspy equivalents.
+    sos = _bandpass_sos(lowcut, highcut, sampling_rate, order)
+    groups = {}
+    for trace in filtered_waveforms:
+        groups.setdefault(trace.stats.npts, []).append(trace)
+    for npts, traces in groups.items():
+        block = np.array([trace.data for trace in traces], dtype=np.float64)
+        block = detrend(block, axis=-1, type="linear", overwrite_data=True)
+        block -= block.mean(axis=-1, keepdims=True)
+        block *= _taper_window(npts)
+        # padtype=None: forward/backward passes over the data as-is, as for the obspy
+        # zero phase-shift filter - the taper ensures there are no edge transients.
+        block = sosfiltfilt(sos, block, axis=-1, padtype=None)
+        for trace, filtered in zip(traces, block):
+            trace.data = filtered
 
     return filtered_waveforms
 
@@ -238,6 +505,14 @@ class STALTAOnset(Onset):
         self.allow_gaps = kwargs.get("allow_gaps", False)
         self.full_timespan = kwargs.get("full_timespan", True)
 
+        # Scratch buffers for the stacked channel signals, keyed by shape - reused
+        # across timesteps in detect(), where the window shapes repeat. Thread-local,
+        # as the phase onsets may be calculated in parallel; the thread pool is kept
+        # alive on the instance (see _phase_executor), so the worker threads - and
+        # their buffers - persist across timesteps.
+        self._scratch = threading.local()
+        self._executor = None
+
         # --- Deprecated ---
         self.onset_centred = kwargs.get("onset_centred")
         self.p_bp_filter = kwargs.get("p_bp_filter")
@@ -299,89 +574,34 @@ class STALTAOnset(Onset):
         filtered_waveforms = Stream()
         availability = {}
 
-        # Loop through phases, pre-process data, and calculate onsets.
-        for phase in self.phases:
-            # Select traces based on channel map for this phase
-            phase_waveforms = data.waveforms.select(channel=self.channel_maps[phase])
-
-            # Convert sta window, lta window lengths from seconds to samples.
-            stw, ltw = self.sta_lta_windows[phase]
-            stw = util.time2sample(stw, self.sampling_rate) + 1
-            ltw = util.time2sample(ltw, self.sampling_rate) + 1
-
-            # Pre-process the data. The ObsPy functions operate by trace, so
-            # will not break on gappy data (we haven't checked availability
-            # yet)
-            filtered_phase_waveforms = pre_process(
-                phase_waveforms,
-                self.sampling_rate,
-                data.resample,
-                data.upfactor,
-                self.bandpass_filters[phase],
-                data.starttime,
-                data.endtime,
-            )
-
-            # Loop through stations, check data availability for this phase,
-            # and store this info, filtered waveforms and calculated onsets
-            for station in data.stations:
-                waveforms = filtered_phase_waveforms.select(station=station)
-
-                available, av_dict = data.check_availability(
-                    waveforms,
-                    all_channels=self.all_channels,
-                    n_channels=self.channel_counts[phase],
-                    allow_gaps=self.allow_gaps,
-                    full_timespan=self.full_timespan,
-                    check_sampling_rate=True,
-                    sampling_rate=self.sampling_rate,
+        # Pre-process data and calculate onsets for each phase. Phases are fully
+        # independent, so on the pure-NumPy path each is computed in its own thread -
+        # the heavy lifting (filtering, STA/LTA calculation) releases the GIL. On the
+        # Numba path the fused onset kernel is already parallelised internally across
+        # all cores, so phase-level threads would only oversubscribe - and entering a
+        # numba parallel region from pool threads hangs the TBB threading layer at
+        # interpreter shutdown - so phases are computed sequentially instead.
+        if len(self.phases) > 1 and not NUMBA_AVAILABLE:
+            results = list(
+                self._phase_executor.map(
+                    lambda phase: self._phase_onsets(data, phase, log, timespan),
+                    self.phases,
                 )
-                availability[f"{station}_{phase}"] = available
-
-                # If no data available, skip
-                if available == 0:
-                    logging.info(f"\t\tNo {phase} onset for {station}.")
-                    continue
-
-                # Check that all channels met the availability critera. If
-                # not, remove this channel from the stream.
-                for key, available in av_dict.items():
-                    if available == 0:
-                        to_remove = waveforms.select(id=key)
-                        [waveforms.remove(tr) for tr in to_remove]
-
-                # Pad with tiny floats so onset will be the correct length.
-                # Note: this will only have an effect if allow_gaps=True or
-                # full_timespan=False. Otherwise, there will be no gaps to pad.
-                if self.allow_gaps or not self.full_timespan:
-                    # Square root to avoid floating point errors when value
-                    # is squared to compute the energy trace
-                    tiny = np.sqrt(np.finfo(float).tiny)
-                    # Apply another taper to remove transients from filtering -
-                    # this is within the pre- and post-pad for continuous data
-                    waveforms.taper(type="cosine", max_percentage=0.05)
-                    # Fill gaps
-                    waveforms.merge(method=1, fill_value=tiny)
-                    # Pad start/end; delta of +/-0.00001 is to avoid
-                    # occasional obspy weirdness. `nearest_sample` is
-                    # appropriate as data is at uniform sampling rate with
-                    # off-sample data corrected by util.shift_to_sample()
-                    waveforms.trim(
-                        starttime=data.starttime - 0.00001,
-                        endtime=data.endtime + 0.00001,
-                        pad=True,
-                        fill_value=tiny,
-                        nearest_sample=False,
-                    )
-
-                # Calculate onset and add to WaveForm data object; add filtered
-                # waveforms that have passed the availability check to
-                # WaveformData.filtered_waveforms
-                onsets_dict.setdefault(station, {}).update(
-                    {phase: self._onset(waveforms, stw, ltw, log, timespan)}
-                )
-                onsets.append(onsets_dict[station][phase])
-                filtered_waveforms += waveforms
+            )
+        else:
+            results = [
+                self._phase_onsets(data, phase, log, timespan) for phase in self.phases
+            ]
+
+        # Merge the per-phase results in phase order, to preserve the ordering of the
+        # stacked onset functions.
+        for phase, result in zip(self.phases, results):
+            phase_onsets, phase_waveforms, phase_availability = result
+            for station, onset in phase_onsets:
+                onsets_dict.setdefault(station, {}).update({phase: onset})
+                onsets.append(onset)
+            filtered_waveforms += phase_waveforms
+            availability.update(phase_availability)
 
         logging.debug(filtered_waveforms.__str__(extended=True))
 
@@ -402,6 +622,121 @@ class STALTAOnset(Onset):
 
         return onsets, onset_data
 
+    def _phase_onsets(self, data, phase, log, timespan):
+        """
+        Pre-process the waveform data and calculate the onset functions for all
+        stations for a single phase.
+
+        Parameters
+        ----------
+        data : :class:`~quakemigrate.io.data.WaveformData` object
+            Light class encapsulating data returned by an archive query.
+        phase : str
+            Phase for which to calculate onset functions, e.g. "P".
+        log : bool
+            Calculate log(onset) if True, otherwise calculate the raw onset.
+        timespan : float or None
+            If a timespan is provided it will be used to calculate the tapered window
+            of data at the start and end of the onset function which should be
+            disregarded.
+
+        Returns
+        -------
+        phase_onsets : list of (str, `numpy.ndarray` of float)
+            (station, onset function) pairs, in station order, for stations which
+            passed the availability checks.
+        filtered_waveforms : `obspy.Stream` object
+            Pre-processed waveforms that passed the availability checks.
+        availability : dict
+            Availability of the requested onset functions, keyed "station_phase".
+
+        """
+
+        # Select traces based on channel map for this phase
+        phase_waveforms = data.waveforms.select(channel=self.channel_maps[phase])
+
+        # Convert sta window, lta window lengths from seconds to samples.
+        stw, ltw = self.sta_lta_windows[phase]
+        stw = util.time2sample(stw, self.sampling_rate) + 1
+        ltw = util.time2sample(ltw, self.sampling_rate) + 1
+
+        # Pre-process the data. The pre-processing operates by trace, so will not
+        # break on gappy data (we haven't checked availability yet)
+        filtered_phase_waveforms = pre_process(
+            phase_waveforms,
+            self.sampling_rate,
+            data.resample,
+            data.upfactor,
+            self.bandpass_filters[phase],
+            data.starttime,
+            data.endtime,
+        )
+
+        phase_onsets = []
+        filtered_waveforms = Stream()
+        availability = {}
+
+        # Loop through stations, check data availability for this phase,
+        # and store this info, filtered waveforms and calculated onsets
+        for station in data.stations:
+            waveforms = filtered_phase_waveforms.select(station=station)
+
+            available, av_dict = data.check_availability(
+                waveforms,
+                all_channels=self.all_channels,
+                n_channels=self.channel_counts[phase],
+                allow_gaps=self.allow_gaps,
+                full_timespan=self.full_timespan,
+                check_sampling_rate=True,
+                sampling_rate=self.sampling_rate,
+            )
+            availability[f"{station}_{phase}"] = available
+
+            # If no data available, skip
+            if available == 0:
+                logging.info(f"\t\tNo {phase} onset for {station}.")
+                continue
+
+            # Check that all channels met the availability critera. If
+            # not, remove this channel from the stream.
+            for key, available in av_dict.items():
+                if available == 0:
+                    to_remove = waveforms.select(id=key)
+                    [waveforms.remove(tr) for tr in to_remove]
+
+            # Pad with tiny floats so onset will be the correct length.
+            # Note: this will only have an effect if allow_gaps=True or
+            # full_timespan=False. Otherwise, there will be no gaps to pad.
+            if self.allow_gaps or not self.full_timespan:
+                # Square root to avoid floating point errors when value
+                # is squared to compute the energy trace
+                tiny = np.sqrt(_DTINY)
+                # Apply another taper to remove transients from filtering -
+                # this is within the pre- and post-pad for continuous data
+                waveforms.taper(type="cosine", max_percentage=0.05)
+                # Fill gaps
+                waveforms.merge(method=1, fill_value=tiny)
+                # Pad start/end; delta of +/-0.00001 is to avoid
+                # occasional obspy weirdness. `nearest_sample` is
+                # appropriate as data is at uniform sampling rate with
+                # off-sample data corrected by util.shift_to_sample()
+                waveforms.trim(
+                    starttime=data.starttime - 0.00001,
+                    endtime=data.endtime + 0.00001,
+                    pad=True,
+                    fill_value=tiny,
+                    nearest_sample=False,
+                )
+
+            # Calculate onset; collect filtered waveforms that have passed the
+            # availability check
+            phase_onsets.append(
+                (station, self._onset(waveforms, stw, ltw, log, timespan))
+            )
+            filtered_waveforms += waveforms
+
+        return phase_onsets, filtered_waveforms, availability
+
     def _onset(self, stream, stw, ltw, log, timespan):
         """
         Generates an onset (characteristic) function. If there are multiple components,
@@ -430,23 +765,104 @@ class STALTAOnset(Onset):
 
         """
 
+        if NUMBA_AVAILABLE:
+            # Stack the channels into a scratch buffer, then compute the combined onset
+            # in a single fused kernel call - the per-channel onset functions are never
+            # materialized. The signals are stacked in float64 - rounding the input to
+            # float32 perturbs the onsets enough to drift from the benchmark outputs.
+            signals = self._signal_buffer((len(stream), stream[0].stats.npts))
+            for i, trace in enumerate(stream):
+                signals[i, :] = trace.data
+            trim_start = trim_end = 0
+            if timespan:
+                taper_pad = self._taper_pad(timespan)
+                trim_start = taper_pad + ltw - 1
+                trim_end = stw + taper_pad
+            if self.position == "centred":
+                classic = False
+            elif self.position == "classic":
+                classic = True
+            return _onset_multi(signals, stw, ltw, classic, log, trim_start, trim_end)
+
+        # Pure-NumPy fallback - per-channel onsets, transformed and combined in place.
         if self.position == "centred":
-            onsets = [sta_lta_centred(tr.data, stw, ltw) for tr in stream]
+            onsets = np.array([sta_lta_centred(tr.data, stw, ltw) for tr in stream])
         elif self.position == "classic":
-            onsets = [classic_sta_lta(tr.data, stw, ltw) for tr in stream]
-        onsets = np.array(onsets)
+            onsets = np.array([classic_sta_lta(tr.data, stw, ltw) for tr in stream])
 
         if timespan:
             onsets = self._trim_taper_pad(onsets, stw, ltw, timespan)
 
-        np.clip(1 + onsets, 0.8, np.inf, onsets)
+        # Onset transform - onsets = log(max(1 + onsets, 0.8)) - applied in-place, one
+        # ufunc at a time, so no intermediate copies are allocated.
+        np.add(onsets, 1, out=onsets)
+        np.clip(onsets, 0.8, None, out=onsets)
         if log:
-            np.log(onsets, onsets)
-
-        onset = np.sqrt(np.sum([onset**2 for onset in onsets], axis=0) / len(onsets))
+            np.log(onsets, out=onsets)
+
+        # Combine the channel onsets as the root-mean-square, without building a list
+        # of squared temporaries. For the common two-channel (S phase; E/N components)
+        # case, np.hypot computes sqrt(E^2 + N^2) in a single ufunc pass.
+        nchannels = len(onsets)
+        if nchannels == 1:
+            onset = np.abs(onsets[0])
+        elif nchannels == 2:
+            onset = np.hypot(onsets[0], onsets[1])
+            onset /= np.sqrt(2)
+        else:
+            np.square(onsets, out=onsets)
+            onset = onsets.mean(axis=0)
+            np.sqrt(onset, out=onset)
 
         return onset
 
+    @property
+    def _phase_executor(self):
+        """
+        Lazily-created thread pool for the per-phase onset calculation on the
+        pure-NumPy path. Kept alive on the instance so the worker threads - and with
+        them the thread-local scratch buffers served by _signal_buffer - persist
+        across detect() timesteps.
+
+        """
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=len(self.phases))
+
+        return self._executor
+
+    def _signal_buffer(self, shape):
+        """
+        Serve a reusable float64 scratch buffer of the given shape for stacking the
+        channel signals. Buffers are allocated on first use and reused across detect()
+        timesteps, where the same shapes recur; only a handful of distinct shapes arise
+        per run, so the cache stays small. Buffers are thread-local, as phase onsets
+        are calculated in parallel.
+
+        Parameters
+        ----------
+        shape : tuple of int
+            Required buffer shape - (nchannels, npts).
+
+        Returns
+        -------
+        buffer : `numpy.ndarray` of `numpy.float64`
+            Scratch buffer, shape(nchannels, npts). Contents are undefined - the caller
+            is expected to overwrite them.
+
+        """
+
+        buffers = getattr(self._scratch, "buffers", None)
+        if buffers is None:
+            buffers = self._scratch.buffers = {}
+        buffer = buffers.get(shape)
+        if buffer is None:
+            # C-order, so each channel's signal occupies a contiguous row - the layout
+            # the kernels are specialized for.
+            buffer = buffers[shape] = np.empty(shape, dtype=np.float64, order="C")
+
+        return buffer
+
     def _trim_taper_pad(self, onsets, stw, ltw, timespan):
         """
         Set the value of the tapered windows at the start and end of the onset function
@@ -472,10 +888,7 @@ class STALTAOnset(Onset):
 
         """
 
-        # Calculate duration of taper pre- and post-pad and convert to samples
-        pre_pad, _ = self.pad(timespan)
-        # Taper pre- and post-pad are identical - just calculate one
-        taper_pad = util.time2sample(pre_pad - self.pre_pad, self.sampling_rate)
+        taper_pad = self._taper_pad(timespan)
 
         for onset in onsets:
             onset[: (taper_pad + ltw - 1)] = 0
@@ -483,6 +896,28 @@ class STALTAOnset(Onset):
 
         return onsets
 
+    def _taper_pad(self, timespan):
+        """
+        Calculate the duration of the taper pre- and post-pad, in samples.
+
+        Parameters
+        ----------
+        timespan : float
+            Used to calculate the tapered window of data at the start and end of the
+            onset function which should be disregarded.
+
+        Returns
+        -------
+        taper_pad : int
+            Number of samples in the tapered pad window - pre- and post-pad are
+            identical, so just calculate one.
+
+        """
+
+        pre_pad, _ = self.pad(timespan)
+
+        return util.time2sample(pre_pad - self.pre_pad, self.sampling_rate)
+
     def gaussian_halfwidth(self, phase):
         """
         Return the phase-appropriate Gaussian half-width estimate based on the
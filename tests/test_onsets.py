@@ -0,0 +1,238 @@
+# -*- coding: utf-8 -*-
+"""
+Test script containing unit tests covering the STA/LTA onset functions contained in
+quakemigrate.signal.onsets.stalta.
+
+:copyright:
+    2020–2023, QuakeMigrate developers.
+:license:
+    GNU General Public License, Version 3
+    (https://www.gnu.org/licenses/gpl-3.0.html)
+
+"""
+
+import unittest
+from copy import deepcopy
+
+import numpy as np
+from obspy import Stream, Trace, UTCDateTime
+
+from quakemigrate.signal.onsets import stalta
+
+
+def waveform_stream(nchannels=3, npts=3001, sampling_rate=50.0):
+    """Create a stream of random waveform data for testing."""
+
+    rand = np.random.RandomState(4824)
+    starttime = UTCDateTime(2014, 8, 24, 0, 0, 0)
+    header = {
+        "network": "Z7",
+        "station": "FLUR",
+        "starttime": starttime,
+        "npts": npts,
+        "sampling_rate": sampling_rate,
+    }
+    stream = Stream()
+    for channel in ["HHZ", "HHN", "HHE"][:nchannels]:
+        header.update({"channel": channel})
+        data = rand.randn(npts)
+        stream += Trace(data=data, header=deepcopy(header))
+
+    return stream
+
+
+def sta_lta_centred_reference(signal, nsta, nlta):
+    """
+    Brute-force reference implementation of the centred STA/LTA - computes each window
+    average explicitly. Slow, but straightforward to verify by inspection.
+
+    """
+
+    energy = np.asarray(signal, dtype=np.float64) ** 2
+    npts = len(energy)
+    onset = np.zeros(npts)
+    dtiny = np.finfo(np.float64).tiny
+    for i in range(nlta - 1, npts - nsta):
+        lta = energy[i + 1 - nlta : i + 1].sum() / nlta
+        if lta < dtiny:
+            continue
+        sta = energy[i + 1 : i + 1 + nsta].sum() / nsta
+        onset[i] = sta / lta
+
+    return onset
+
+
+class TestSTALTA(unittest.TestCase):
+    """Suite of tests covering the STA/LTA onset function calculations."""
+
+    def setUp(self):
+        """Create some test signals."""
+
+        rand = np.random.RandomState(1910)
+        self.signal = rand.randn(2000)
+        # Signal with a flatlined (zero) section, to exercise the divide-by-zero guard
+        self.gappy_signal = self.signal.copy()
+        self.gappy_signal[400:800] = 0.0
+
+    def test_sta_lta_centred(self):
+        """Check the centred STA/LTA against the brute-force reference."""
+
+        for signal in [self.signal, self.gappy_signal]:
+            for nsta, nlta in [(11, 51), (21, 101)]:
+                expected = sta_lta_centred_reference(signal, nsta, nlta)
+                onset = stalta.sta_lta_centred(signal, nsta, nlta)
+                np.testing.assert_allclose(onset, expected, rtol=1e-9, atol=1e-12)
+
+    def test_sta_lta_centred_implementations_agree(self):
+        """Check the Numba kernel and the NumPy fallback produce the same result."""
+
+        if not stalta.NUMBA_AVAILABLE:
+            self.skipTest("numba is not installed")
+
+        for signal in [self.signal, self.gappy_signal]:
+            numba_onset = stalta._sta_lta_centred_numba(signal, 11, 51)
+            numpy_onset = stalta._sta_lta_centred_numpy(signal, 11, 51)
+            np.testing.assert_allclose(numba_onset, numpy_onset, rtol=1e-9, atol=1e-12)
+
+    def test_sta_lta_centred_float32(self):
+        """Check float32 input gives results consistent with float64."""
+
+        if not stalta.NUMBA_AVAILABLE:
+            self.skipTest("numba is not installed")
+
+        onset_f8 = stalta._sta_lta_centred_numba(self.signal, 11, 51)
+        onset_f4 = stalta._sta_lta_centred_numba(
+            self.signal.astype(np.float32), 11, 51
+        )
+        np.testing.assert_allclose(onset_f4, onset_f8, rtol=1e-4, atol=1e-6)
+
+    def test_sta_lta_classic_matches_obspy(self):
+        """
+        Check the classic STA/LTA kernel against the obspy implementation. The exact
+        (cumsum-based) classic_sta_lta_py is used as the reference - the C version
+        (classic_sta_lta) is a rolling implementation which accumulates floating-point
+        drift, and returns stale values within flatlined (zero) data sections.
+
+        """
+
+        if not stalta.NUMBA_AVAILABLE:
+            self.skipTest("numba is not installed")
+
+        from obspy.signal.trigger import classic_sta_lta_py
+
+        for signal in [self.signal, self.gappy_signal]:
+            for nsta, nlta in [(11, 51), (21, 101)]:
+                expected = classic_sta_lta_py(signal, nsta, nlta)
+                onset = stalta._sta_lta_classic_numba(signal, nsta, nlta)
+                np.testing.assert_allclose(onset, expected, rtol=1e-9, atol=1e-12)
+
+class TestSTALTAOnset(unittest.TestCase):
+    """Suite of tests covering the STALTAOnset class."""
+
+    def test_calculate_onsets(self):
+        """
+        End-to-end check of calculate_onsets for a two-phase setup - phases are
+        calculated concurrently, and the stacked onsets must retain phase-major,
+        station-major ordering.
+
+        """
+
+        from quakemigrate.io.data import WaveformData
+        from quakemigrate.signal.onsets import STALTAOnset
+
+        stream = waveform_stream()
+        data = WaveformData(
+            starttime=stream[0].stats.starttime,
+            endtime=stream[0].stats.endtime,
+            stations=["FLUR"],
+        )
+        data.waveforms = stream
+
+        onset = STALTAOnset(position="classic", sampling_rate=50)
+        onsets, onset_data = onset.calculate_onsets(data)
+
+        self.assertEqual(onsets.shape[0], 2)
+        self.assertEqual(onset_data.availability, {"FLUR_P": 1, "FLUR_S": 1})
+        np.testing.assert_array_equal(onsets[0], onset_data.onsets["FLUR"]["P"])
+        np.testing.assert_array_equal(onsets[1], onset_data.onsets["FLUR"]["S"])
+        # P onset is single-channel (Z); S onset combines the two horizontals
+        self.assertEqual(onsets.dtype, np.float64)
+        self.assertTrue(np.all(np.isfinite(onsets)))
+
+
+    def test_onset_fused_kernel_matches_fallback(self):
+        """
+        Check the fused onset kernel against the pure-NumPy fallback path, for both
+        onset positions, with and without taper trimming, raw and log onsets.
+
+        """
+
+        from quakemigrate.signal.onsets import STALTAOnset
+
+        if not stalta.NUMBA_AVAILABLE:
+            self.skipTest("numba is not installed")
+
+        stream = stalta.pre_process(
+            waveform_stream(),
+            50,
+            False,
+            None,
+            [2.0, 16.0, 2],
+            waveform_stream()[0].stats.starttime,
+            waveform_stream()[0].stats.endtime,
+        )
+
+        for position in ["classic", "centred"]:
+            onset = STALTAOnset(position=position, sampling_rate=50)
+            for log in [True, False]:
+                for timespan in [None, 30.0]:
+                    fused = onset._onset(stream, 11, 51, log, timespan)
+                    try:
+                        stalta.NUMBA_AVAILABLE = False
+                        fallback = onset._onset(stream, 11, 51, log, timespan)
+                    finally:
+                        stalta.NUMBA_AVAILABLE = True
+                    np.testing.assert_allclose(fused, fallback, rtol=1e-4, atol=1e-6)
+
+
+class TestPreProcess(unittest.TestCase):
+    """Suite of tests covering the waveform pre-processing."""
+
+    def test_filter_matches_obspy(self):
+        """Check the batched band-pass filter matches the obspy implementation."""
+
+        stream = waveform_stream()
+        starttime = stream[0].stats.starttime
+        endtime = stream[0].stats.endtime
+
+        filtered = stalta.pre_process(
+            stream, 50, False, None, [2.0, 16.0, 2], starttime, endtime
+        )
+
+        expected = stream.copy()
+        expected.detrend("linear")
+        expected.detrend("constant")
+        expected.taper(type="cosine", max_percentage=0.05)
+        expected.filter(
+            type="bandpass", freqmin=2.0, freqmax=16.0, corners=2, zerophase=True
+        )
+
+        self.assertEqual(len(filtered), len(expected))
+        for tr_filtered, tr_expected in zip(filtered, expected):
+            # The backward-pass initial conditions used by sosfiltfilt differ slightly
+            # from the obspy two-pass filter, so the trailing taper region (which is
+            # discarded downstream) is only compared loosely.
+            taper_len = int(0.05 * tr_expected.stats.npts)
+            np.testing.assert_allclose(
+                tr_filtered.data[:-taper_len],
+                tr_expected.data[:-taper_len],
+                rtol=1e-7,
+                atol=1e-10,
+            )
+            np.testing.assert_allclose(
+                tr_filtered.data[-taper_len:], tr_expected.data[-taper_len:], atol=1e-2
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()